@@ -0,0 +1,100 @@
+"""Shared HTTP helper for the paper-review scripts.
+
+Routes requests through a single pooled requests.Session when the
+requests package is installed, so repeated calls to the same host
+(arXiv, GitHub, Notion) reuse one TCP+TLS connection instead of
+handshaking per call. Falls back to urllib so the scripts stay usable
+with the stdlib alone.
+
+The urlopen() here mirrors urllib's interface: the returned object has
+.read()/.headers/.status, and 4xx/5xx responses raise
+urllib.error.HTTPError regardless of backend.
+"""
+import random
+import time
+import urllib.error
+import urllib.request
+
+# Statuses worth retrying: rate limits and transient server errors.
+RETRYABLE_STATUSES = (403, 429, 503)
+MAX_BACKOFF = 60
+
+try:
+    import requests as _requests
+    _session = _requests.Session()
+except ImportError:
+    _requests = None
+    _session = None
+
+
+class _SessionResponse:
+    """Wrap a requests response to look like urllib's addinfourl."""
+
+    def __init__(self, resp):
+        self._resp = resp
+        self.headers = resp.headers
+        self.status = resp.status_code
+        resp.raw.decode_content = True
+
+    def read(self, amt=None):
+        return self._resp.raw.read(amt)
+
+
+def urlopen(url: str, data: bytes = None, headers: dict = None,
+            method: str = None, timeout: float = 30):
+    """Open url, reusing a pooled connection when requests is available."""
+    headers = headers or {}
+    if _session is not None:
+        m = method or ("POST" if data is not None else "GET")
+        resp = _session.request(m, url, data=data, headers=headers,
+                                timeout=timeout, stream=True)
+        if resp.status_code >= 400:
+            raise urllib.error.HTTPError(
+                url, resp.status_code, resp.reason, resp.headers, resp.raw)
+        return _SessionResponse(resp)
+
+    req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    return urllib.request.urlopen(req, timeout=timeout)
+
+
+def _retry_delay(headers, attempt: int) -> float:
+    """Honor Retry-After when present, else exponential backoff + jitter."""
+    retry_after = headers.get("Retry-After") if headers else None
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_BACKOFF)
+        except ValueError:
+            pass
+    return min(2 ** attempt + random.random(), MAX_BACKOFF)
+
+
+def _respect_rate_limit(headers) -> None:
+    """If GitHub says the rate budget is nearly gone, wait for the reset."""
+    try:
+        remaining = int(headers.get("X-RateLimit-Remaining"))
+        reset = float(headers.get("X-RateLimit-Reset"))
+    except (TypeError, ValueError):
+        return
+    if remaining < 5:
+        time.sleep(max(0.0, min(reset - time.time(), MAX_BACKOFF)))
+
+
+def urlopen_with_backoff(url: str, data: bytes = None, headers: dict = None,
+                         method: str = None, timeout: float = 30,
+                         max_retries: int = 5):
+    """urlopen that retries 403/429/503 with backoff instead of failing.
+
+    Rate-limited and transient-error responses become controlled waits,
+    so a batch run degrades to slower instead of silently losing data.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            resp = urlopen(url, data=data, headers=headers,
+                           method=method, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            if e.code not in RETRYABLE_STATUSES or attempt == max_retries:
+                raise
+            time.sleep(_retry_delay(e.headers, attempt))
+            continue
+        _respect_rate_limit(resp.headers)
+        return resp
@@ -13,41 +13,68 @@ Strategy:
 Outputs JSON: { "repos": [{"url": ..., "stars": ..., "description": ..., "source": ...}] }
 """
 import argparse
+import functools
+import hashlib
 import json
+import os
 import re
 import sys
-import urllib.request
+import time
+import urllib.error
 import urllib.parse
 
+import _http
+
+# Search results are cached in-memory (per run) and on disk (across runs,
+# 1h TTL) — batch reviews repeat the same queries constantly.
+SEARCH_CACHE_DIR = os.path.expanduser("~/.cache/paper-review/github")
+SEARCH_CACHE_TTL = 3600
+
+# Compiled once at import — this scans up to 100K chars of paper text per
+# call. Owner/repo character classes follow GitHub's own naming rules
+# (user: 39 alnum/hyphen chars, repo: alnum/._-), which are bounded and
+# anchored enough that the pattern cannot backtrack on adversarial text.
+_GITHUB_URL_RE = re.compile(
+    r"https?://github\.com/([A-Za-z0-9][A-Za-z0-9-]{0,38})/([A-Za-z0-9_.-]{1,100})"
+)
+
 
 def find_github_urls_in_text(text: str) -> list:
     """Extract GitHub repo URLs from paper text."""
-    pattern = r"https?://github\.com/([a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+)"
-    matches = re.findall(pattern, text)
     # Deduplicate, preserve order
     seen = set()
     urls = []
-    for m in matches:
+    for owner, repo in _GITHUB_URL_RE.findall(text):
         # Clean trailing periods, commas
-        m = m.rstrip(".,;)")
-        if m not in seen:
-            seen.add(m)
-            urls.append(f"https://github.com/{m}")
+        full = f"{owner}/{repo.rstrip('.,;)')}"
+        if full not in seen:
+            seen.add(full)
+            urls.append(f"https://github.com/{full}")
     return urls
 
 
+@functools.lru_cache(maxsize=512)
 def search_github(query: str, max_results: int = 5) -> list:
-    """Search GitHub repos by query."""
+    """Search GitHub repos by query. Results are cached (memory + disk)."""
+    cache_key = hashlib.sha1(f"{query}|{max_results}".encode()).hexdigest()
+    cache_path = os.path.join(SEARCH_CACHE_DIR, f"{cache_key}.json")
+    try:
+        if time.time() - os.path.getmtime(cache_path) < SEARCH_CACHE_TTL:
+            with open(cache_path) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
     encoded = urllib.parse.quote(query)
     url = f"https://api.github.com/search/repositories?q={encoded}&sort=stars&per_page={max_results}"
-    req = urllib.request.Request(url, headers={
+    headers = {
         "User-Agent": "paper-review-skill/1.0",
         "Accept": "application/vnd.github.v3+json",
-    })
+    }
     try:
-        resp = urllib.request.urlopen(req, timeout=15)
+        resp = _http.urlopen_with_backoff(url, headers=headers, timeout=15)
         data = json.loads(resp.read())
-        return [
+        results = [
             {
                 "url": item["html_url"],
                 "stars": item["stargazers_count"],
@@ -60,17 +87,82 @@ def search_github(query: str, max_results: int = 5) -> list:
         print(f"GitHub search error: {e}", file=sys.stderr)
         return []
 
+    os.makedirs(SEARCH_CACHE_DIR, exist_ok=True)
+    with open(cache_path, "w") as f:
+        json.dump(results, f)
+    return results
+
+
+def fetch_repo_info(full_name: str) -> dict:
+    """Look up one repo directly — far cheaper against the rate limit
+    than a /search call. Returns None if the repo doesn't resolve.
+
+    Results are cached on disk like search results; a definitive 404 is
+    cached as null so repeat runs don't re-ask for dead links. Transient
+    errors are not cached and retry next call.
+    """
+    cache_key = hashlib.sha1(f"repo:{full_name}".encode()).hexdigest()
+    cache_path = os.path.join(SEARCH_CACHE_DIR, f"{cache_key}.json")
+    try:
+        if time.time() - os.path.getmtime(cache_path) < SEARCH_CACHE_TTL:
+            with open(cache_path) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    url = f"https://api.github.com/repos/{full_name}"
+    headers = {
+        "User-Agent": "paper-review-skill/1.0",
+        "Accept": "application/vnd.github.v3+json",
+    }
+    try:
+        resp = _http.urlopen_with_backoff(url, headers=headers, timeout=15)
+        item = json.loads(resp.read())
+        info = {
+            "url": item["html_url"],
+            "stars": item["stargazers_count"],
+            "description": item.get("description", ""),
+            "source": "paper_text",
+        }
+    except urllib.error.HTTPError as e:
+        if e.code != 404:
+            print(f"GitHub repo lookup error ({full_name}): {e}", file=sys.stderr)
+            return None
+        info = None
+    except Exception as e:
+        print(f"GitHub repo lookup error ({full_name}): {e}", file=sys.stderr)
+        return None
+
+    os.makedirs(SEARCH_CACHE_DIR, exist_ok=True)
+    with open(cache_path, "w") as f:
+        json.dump(info, f)
+    return info
 
-def find_repo(title: str = "", authors: str = "", text: str = "") -> dict:
+
+def find_repo(title: str = "", authors: str = "", text: str = "", exhaustive: bool = False) -> dict:
     """Find GitHub repos for a paper."""
     repos = []
-    
+
     # Strategy 1: Extract URLs from paper text
     if text:
         urls = find_github_urls_in_text(text)
-        for url in urls:
-            repos.append({"url": url, "stars": None, "description": "", "source": "paper_text"})
-    
+        confirmed = False
+        # Papers routinely cite dozens of repos in their references, so
+        # only the first link — nearly always the paper's own — gets the
+        # verification call; the rest pass through unverified.
+        for i, url in enumerate(urls):
+            info = fetch_repo_info(url.removeprefix("https://github.com/")) if i == 0 else None
+            if info is not None:
+                repos.append(info)
+                confirmed = True
+            else:
+                repos.append({"url": url, "stars": None, "description": "", "source": "paper_text"})
+        # A live repo linked from the paper itself is almost always the
+        # canonical one — don't spend two search-API calls confirming it
+        # unless the caller asked to be exhaustive.
+        if confirmed and not exhaustive:
+            return {"repos": repos}
+
     # Strategy 2: Search GitHub by title
     if title:
         results = search_github(title)
@@ -95,14 +187,17 @@ def main():
     parser.add_argument("--authors", default="", help="Comma-separated authors")
     parser.add_argument("--text", default="", help="Paper text to search for GitHub links")
     parser.add_argument("--text-file", help="File containing paper text")
+    parser.add_argument("--exhaustive", action="store_true",
+                        help="Run GitHub searches even when the paper text links a live repo")
     args = parser.parse_args()
-    
+
     text = args.text
     if args.text_file:
         with open(args.text_file) as f:
             text = f.read()
-    
-    result = find_repo(title=args.title, authors=args.authors, text=text)
+
+    result = find_repo(title=args.title, authors=args.authors, text=text,
+                       exhaustive=args.exhaustive)
     print(json.dumps(result, indent=2, ensure_ascii=False))
 
 
@@ -10,12 +10,52 @@ Blocks JSON: array of Notion block objects (the page body)
 Requires: NOTION_API_KEY env var or ~/.config/notion/api_key
 """
 import argparse
+import functools
 import json
 import os
 import sys
-import urllib.request
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import _http
 
+# Notion allows ~3 requests/second on average; concurrent calls share a
+# token bucket so parallelism speeds things up without tripping 429s.
+NOTION_RATE_LIMIT = 3
+DELETE_WORKERS = 8
+
+# The Papers DB ID is static once discovered — cache it across runs so
+# exports skip the two /search round-trips.
+DB_CACHE_FILE = os.path.expanduser("~/.cache/paper-review/notion_db.json")
+
+
+class _RateLimiter:
+    """Token bucket shared by concurrent Notion requests."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_rate_limiter = _RateLimiter(NOTION_RATE_LIMIT)
+
+
+@functools.lru_cache(maxsize=1)
 def get_api_key() -> str:
     key = os.environ.get("NOTION_API_KEY")
     if key:
@@ -26,41 +66,71 @@ def get_api_key() -> str:
     raise RuntimeError("No Notion API key found")
 
 
-def find_or_create_papers_db() -> str:
-    """Find the Papers database by searching Notion. Create it if not found."""
-    key = get_api_key()
-    headers = {
-        "Authorization": "Bearer " + key,
+@functools.lru_cache(maxsize=1)
+def _notion_headers() -> dict:
+    """Request headers for the Notion API, built once per run."""
+    return {
+        "Authorization": f"Bearer {get_api_key()}",
         "Notion-Version": "2022-06-28",
         "Content-Type": "application/json",
     }
-    
+
+
+def _read_cached_db_id() -> str:
+    """Return the cached Papers DB ID if it still resolves, else None."""
+    try:
+        with open(DB_CACHE_FILE) as f:
+            db_id = json.load(f)["db_id"]
+    except (OSError, ValueError, KeyError):
+        return None
+    # One cheap GET confirms the DB wasn't deleted or unshared
+    try:
+        _http.urlopen_with_backoff(f"https://api.notion.com/v1/databases/{db_id}",
+                                   headers=_notion_headers())
+        return db_id
+    except Exception:
+        return None
+
+
+def _write_cached_db_id(db_id: str) -> None:
+    os.makedirs(os.path.dirname(DB_CACHE_FILE), exist_ok=True)
+    with open(DB_CACHE_FILE, "w") as f:
+        json.dump({"db_id": db_id, "ts": time.time()}, f)
+
+
+def find_or_create_papers_db() -> str:
+    """Find the Papers database by searching Notion. Create it if not found.
+
+    The discovered ID is cached on disk, so steady-state exports skip
+    the /search round-trips entirely.
+    """
+    db_id = _read_cached_db_id()
+    if db_id:
+        return db_id
+
+    headers = _notion_headers()
+
     # Search for existing
     payload = json.dumps({
         "filter": {"property": "object", "value": "database"},
         "query": "Papers"
     }).encode()
-    req = urllib.request.Request(
-        "https://api.notion.com/v1/search",
-        data=payload, headers=headers, method="POST"
-    )
-    resp = urllib.request.urlopen(req)
+    resp = _http.urlopen_with_backoff("https://api.notion.com/v1/search",
+                         data=payload, headers=headers, method="POST")
     data = json.loads(resp.read())
     for db in data.get("results", []):
         title = "".join(t["plain_text"] for t in db.get("title", []))
         if title.strip().lower() == "papers":
+            _write_cached_db_id(db["id"])
             return db["id"]
-    
+
     # Not found — find a top-level page to use as parent
     payload = json.dumps({
         "filter": {"property": "object", "value": "page"},
         "page_size": 10
     }).encode()
-    req = urllib.request.Request(
-        "https://api.notion.com/v1/search",
-        data=payload, headers=headers, method="POST"
-    )
-    resp = urllib.request.urlopen(req)
+    resp = _http.urlopen_with_backoff("https://api.notion.com/v1/search",
+                         data=payload, headers=headers, method="POST")
     pages = json.loads(resp.read()).get("results", [])
     
     if not pages:
@@ -92,23 +162,16 @@ def find_or_create_papers_db() -> str:
             "Summary": {"rich_text": {}}
         }
     }).encode()
-    req = urllib.request.Request(
-        "https://api.notion.com/v1/databases",
-        data=db_payload, headers=headers, method="POST"
-    )
-    resp = urllib.request.urlopen(req)
+    resp = _http.urlopen_with_backoff("https://api.notion.com/v1/databases",
+                         data=db_payload, headers=headers, method="POST")
     db = json.loads(resp.read())
     print(f"Created Papers database: {db['id']}", file=sys.stderr)
+    _write_cached_db_id(db["id"])
     return db["id"]
 
 
 def create_page(db_id: str, properties: dict, blocks: list) -> dict:
-    key = get_api_key()
-    headers = {
-        "Authorization": f"Bearer {key}",
-        "Notion-Version": "2022-06-28",
-        "Content-Type": "application/json",
-    }
+    headers = _notion_headers()
     
     # Build Notion properties
     notion_props = {}
@@ -139,66 +202,68 @@ def create_page(db_id: str, properties: dict, blocks: list) -> dict:
     
     # Create page first (without blocks — blocks added separately to handle >100)
     data = json.dumps(payload).encode()
-    req = urllib.request.Request(
-        "https://api.notion.com/v1/pages",
-        data=data, headers=headers, method="POST"
-    )
-    resp = urllib.request.urlopen(req)
+    resp = _http.urlopen_with_backoff("https://api.notion.com/v1/pages",
+                         data=data, headers=headers, method="POST")
     page = json.loads(resp.read())
     page_id = page["id"]
     
-    # Append blocks in batches of 100
-    for i in range(0, len(blocks), 100):
-        batch = blocks[i:i+100]
-        block_payload = {"children": [{"object": "block", **b} for b in batch]}
-        data = json.dumps(block_payload).encode()
-        req = urllib.request.Request(
-            f"https://api.notion.com/v1/blocks/{page_id}/children",
-            data=data, headers=headers, method="PATCH"
-        )
-        urllib.request.urlopen(req)
-    
+    _append_blocks(page_id, blocks, headers)
     return page
 
 
+def _append_blocks(page_id: str, blocks: list, headers: dict) -> None:
+    """Append blocks in batches of 100 (Notion's per-request limit).
+
+    Batches stay sequential: Notion appends children in request order,
+    so parallel PATCHes would scramble the page body.
+    """
+    # Normalize in place once — batches are then plain slices instead of
+    # rebuilding every block dict per batch.
+    for b in blocks:
+        b.setdefault("object", "block")
+
+    for i in range(0, len(blocks), 100):
+        payload = {"children": blocks[i:i+100]}
+        data = json.dumps(payload).encode()
+        _rate_limiter.acquire()
+        _http.urlopen_with_backoff(f"https://api.notion.com/v1/blocks/{page_id}/children",
+                      data=data, headers=headers, method="PATCH")
+
+
+def _delete_blocks(block_ids: list, headers: dict) -> None:
+    """Delete blocks concurrently — deletes are independent of each other."""
+    def delete_one(block_id):
+        _rate_limiter.acquire()
+        try:
+            _http.urlopen_with_backoff(f"https://api.notion.com/v1/blocks/{block_id}",
+                          headers=headers, method="DELETE")
+        except Exception:
+            pass
+
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as ex:
+        list(ex.map(delete_one, block_ids))
+
+
 def update_page(page_id: str, blocks: list) -> None:
     """Replace all blocks on an existing page."""
-    key = get_api_key()
-    headers = {
-        "Authorization": f"Bearer {key}",
-        "Notion-Version": "2022-06-28",
-        "Content-Type": "application/json",
-    }
-    
-    # Delete existing blocks
+    headers = _notion_headers()
+
+    # Collect all existing block IDs first, then delete them in parallel
+    block_ids = []
     url = f"https://api.notion.com/v1/blocks/{page_id}/children?page_size=100"
     while True:
-        req = urllib.request.Request(url, headers=headers)
-        resp = urllib.request.urlopen(req)
+        resp = _http.urlopen_with_backoff(url, headers=headers)
         data = json.loads(resp.read())
-        for block in data.get("results", []):
-            dreq = urllib.request.Request(
-                f"https://api.notion.com/v1/blocks/{block['id']}",
-                headers=headers, method="DELETE"
-            )
-            try:
-                urllib.request.urlopen(dreq)
-            except:
-                pass
+        block_ids.extend(b["id"] for b in data.get("results", []))
         if not data.get("has_more"):
             break
         url = f"https://api.notion.com/v1/blocks/{page_id}/children?page_size=100&start_cursor={data['next_cursor']}"
-    
+
+    if block_ids:
+        _delete_blocks(block_ids, headers)
+
     # Append new blocks
-    for i in range(0, len(blocks), 100):
-        batch = blocks[i:i+100]
-        payload = {"children": [{"object": "block", **b} for b in batch]}
-        data = json.dumps(payload).encode()
-        req = urllib.request.Request(
-            f"https://api.notion.com/v1/blocks/{page_id}/children",
-            data=data, headers=headers, method="PATCH"
-        )
-        urllib.request.urlopen(req)
+    _append_blocks(page_id, blocks, headers)
 
 
 def main():